@@ -1,6 +1,6 @@
 from typing import Callable
-from game_utils import TileEventType, TileButtonState, TileNumberColor, Board, GameMode, Cfg
-from PySide6.QtCore import QSize, Qt, QTimer
+from game_utils import TileEventType, TileButtonState, TileNumberColor, Board, Game, GameMode, GameClock, Move, Cfg
+from PySide6.QtCore import QEvent, QObject, QSize, Qt, QTimer
 from PySide6.QtGui import QMouseEvent
 from PySide6.QtWidgets import (
   QFrame,
@@ -12,7 +12,6 @@ from PySide6.QtWidgets import (
   QPushButton,
   QStackedWidget,
   QLCDNumber,
-  QApplication,
 )
 
 
@@ -39,44 +38,21 @@ class TileButton(QPushButton):
       case TileButtonState.QUESTION:
         self.setText(Cfg.tile_txt_question)
 
-  def cycle_state(self) -> None:
-    self.state = TileButtonState.next(self.state)
+  def set_state(self, state: TileButtonState) -> None:
+    self.state = state
     self.__decorate_button()
 
-  # button hijacks left mouse clicks => propagate event to parent
-  def mouseReleaseEvent(self, e: QMouseEvent) -> None:
-    parent = self.parent()
-    if parent and e.button() == Qt.LeftButton:
-      QApplication.sendEvent(parent, e)
-    return super().mouseReleaseEvent(e)
-
 
 class Tile(QStackedWidget):
-  __slots__ = (
-    '__row',
-    '__col',
-    '__val',
-    '__label',
-    '__label_idx',
-    '__btn',
-    '__btn_idx',
-    '__revealed',
-    '__flagged',
-    '__tile_event_callback',
-    '__neighbors',
-  )
+  __slots__ = ('__row', '__col', '__label', '__label_idx', '__btn', '__btn_idx')
 
-  def __init__(
-    self, row: int, col: int, callback: Callable[[TileEventType, 'Tile'], None], parent: QWidget = None
-  ) -> None:
+  def __init__(self, row: int, col: int, parent: QWidget = None) -> None:
     super().__init__(parent)
 
     self.__row = row
     self.__col = col
-    self.__val = 0
-    self.__tile_event_callback = callback
-    self.__revealed = False
-    self.__flagged = False
+    # mouse input is handled by the grid's GridInputFilter => let events fall through to the grid
+    self.setAttribute(Qt.WA_TransparentForMouseEvents)
     self.setStyleSheet('background-color: #f0f0f0;')
     self.setFixedSize(QSize(Cfg.game_btn_height, Cfg.game_btn_height))
 
@@ -99,71 +75,120 @@ class Tile(QStackedWidget):
   def col(self) -> int:
     return self.__col
 
-  @property
-  def val(self) -> int:
-    return self.__val
+  def init(self, val: int) -> None:
+    self.__label.setText(Cfg.tile_txt_mine if val == -1 else str(val))
+    self.__label.setStyleSheet(
+      'font-size: 18px; font-weight: bold;'
+      if val == -1
+      else f'color: rgb{TileNumberColor.by_val(val).value}; font-size: 18px; font-weight: bold;'
+    )
 
-  @val.setter
-  def val(self, value: int) -> None:
-    self.__val = value
+  def set_mark(self, state: TileButtonState) -> None:
+    self.__btn.set_state(state)
 
-  @property
-  def flagged(self) -> bool:
-    return self.__flagged
+  def reveal(self) -> None:
+    self.setCurrentIndex(self.__label_idx)
 
-  @property
-  def revealed(self) -> bool:
-    return self.__revealed
 
-  @property
-  def neighbors(self) -> list['Tile']:
-    return self.__neighbors
+class GridInputFilter(QObject):
+  __slots__ = ('__rows', '__cols', '__act_on_press', '__callback', '__chording', '__last_action', '__last_time')
 
-  @neighbors.setter
-  def neighbors(self, value: list['Tile']) -> None:
-    self.__neighbors = value
+  __CHORD = Qt.LeftButton | Qt.RightButton
 
-  def init(self) -> None:
-    self.__label.setText(Cfg.tile_txt_mine if self.__val == -1 else str(self.__val))
-    self.__label.setStyleSheet(
-      'font-size: 18px; font-weight: bold;'
-      if self.__val == -1
-      else f'color: rgb{TileNumberColor.by_val(self.__val).value}; font-size: 18px; font-weight: bold;'
-    )
+  def __init__(
+    self,
+    rows: int,
+    cols: int,
+    act_on_press: bool,
+    callback: Callable[[TileEventType, int, int, int], None],
+    parent: QObject = None,
+  ) -> None:
+    super().__init__(parent)
 
-  def increment_value(self) -> None:
-    if self.__val == -1:
+    self.__rows = rows
+    self.__cols = cols
+    self.__act_on_press = act_on_press
+    self.__callback = callback
+    self.__chording = False
+    self.__last_action: tuple[TileEventType, int, int] = None
+    self.__last_time = 0
+
+  def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+    match event.type():
+      # a fast second click arrives as a double click instead of a press
+      case QEvent.MouseButtonPress | QEvent.MouseButtonDblClick:
+        self.__handle_press(watched, event)
+      case QEvent.MouseButtonRelease:
+        self.__handle_release(watched, event)
+      case _:
+        return False
+    return True
+
+  def __cell_at(self, grid: QWidget, event: QMouseEvent) -> tuple[int, int] | None:
+    margins = grid.layout().contentsMargins()
+    pos = event.position().toPoint()
+    x = pos.x() - margins.left()
+    y = pos.y() - margins.top()
+    if x < 0 or y < 0:
+      return None
+
+    row, col = y // Cfg.game_btn_height, x // Cfg.game_btn_height
+    if row >= self.__rows or col >= self.__cols:
+      return None
+    return row, col
+
+  def __handle_press(self, grid: QWidget, event: QMouseEvent) -> None:
+    # second button of a left + right chord went down
+    if (event.buttons() & self.__CHORD) == self.__CHORD:
+      self.__chording = True
+      if self.__act_on_press:
+        self.__dispatch(TileEventType.CHORD, grid, event)
       return
-    self.__val += 1
-
-  def mouseReleaseEvent(self, event: QMouseEvent) -> None:
-    match event.button():
-      case Qt.LeftButton:  # left click, only care if tile is not revealed or protected
-        if not self.__revealed and not self.__flagged:
-          self.__tile_event_callback(TileEventType.OPENSINGLE, self)
-        elif self.__revealed:
-          self.__tile_event_callback(TileEventType.OPENSQUARE, self)
-      case Qt.MiddleButton:  # middle click, only care if tile is revealed
-        self.__tile_event_callback(TileEventType.OPENSQUARE, self)
-      case Qt.RightButton:  # right click, only care if tile is not revealed
-        self.__tile_event_callback(TileEventType.MARK, self)
-
-    return super().mousePressEvent(event)
-
-  def change_mark(self) -> None:
-    self.__btn.cycle_state()
-    if self.__flagged and self.__btn.state != TileButtonState.FLAGGED:
-      self.__flagged = False
-    elif self.__btn.state == TileButtonState.FLAGGED and not self.__flagged:
-      self.__flagged = True
 
-  def reveal(self) -> None:
-    self.__revealed = True
-    self.setCurrentIndex(self.__label_idx)
+    if self.__act_on_press:
+      self.__dispatch(self.__event_for(event.button()), grid, event)
+
+  def __handle_release(self, grid: QWidget, event: QMouseEvent) -> None:
+    if self.__chording:
+      # chord fires on the first of the two buttons going up, the other release is swallowed
+      if event.buttons() & self.__CHORD:
+        if not self.__act_on_press:
+          self.__dispatch(TileEventType.CHORD, grid, event)
+      else:
+        self.__chording = False
+      return
+
+    if not self.__act_on_press:
+      self.__dispatch(self.__event_for(event.button()), grid, event)
+
+  def __dispatch(self, tile_event: TileEventType | None, grid: QWidget, event: QMouseEvent) -> None:
+    cell = self.__cell_at(grid, event)
+    if tile_event is None or cell is None:
+      return
+
+    # coalesce identical actions arriving within a single frame
+    action = (tile_event, *cell)
+    if action == self.__last_action and event.timestamp() - self.__last_time < Cfg.game_frame_ms:
+      return
+
+    self.__last_action = action
+    self.__last_time = event.timestamp()
+    self.__callback(*action, event.timestamp())
+
+  @staticmethod
+  def __event_for(button: Qt.MouseButton) -> TileEventType | None:
+    match button:
+      case Qt.LeftButton:
+        return TileEventType.OPENSINGLE
+      case Qt.MiddleButton:
+        return TileEventType.OPENSQUARE
+      case Qt.RightButton:
+        return TileEventType.MARK
+    return None
 
 
 class GameHeader(QWidget):
-  __slots__ = ('__lcd_mines', '__lcd_timer', '__stopwatch')
+  __slots__ = ('__lcd_mines', '__lcd_timer', '__clock', '__refresh')
 
   def __init__(self, restart: Callable[[], None], activate_menu: Callable[[], None], parent: QWidget = None) -> None:
     super().__init__(parent)
@@ -181,12 +206,9 @@ class GameHeader(QWidget):
       parent=self, digitCount=3, size=QSize(Cfg.game_btn_width, Cfg.game_btn_height), mode=QLCDNumber.Dec
     )
 
-    self.__stopwatch = QTimer(
-      parent=self,
-      timeout=lambda: self.__lcd_timer.display(self.__lcd_timer.intValue() + 1),
-      interval=1000,
-      singleShot=False,
-    )
+    # the clock is the record of time, the timer only wakes up when the displayed second changes
+    self.__clock = GameClock()
+    self.__refresh = QTimer(parent=self, timeout=self.__refresh_timer, singleShot=True, timerType=Qt.PreciseTimer)
 
     layout.addWidget(self.__lcd_mines, 1, Qt.AlignLeft)
     layout.addWidget(btn_menu, 1, Qt.AlignCenter)
@@ -208,78 +230,86 @@ class GameHeader(QWidget):
     self.__lcd_mines.display(value)
 
   @property
-  def time(self) -> int:
-    return self.__lcd_timer.intValue()
+  def paused_time(self) -> int:
+    return self.__clock.paused_ms
+
+  def __refresh_timer(self) -> None:
+    elapsed = self.__clock.elapsed_ms
+    if elapsed // 1000 != self.__lcd_timer.intValue():
+      self.__lcd_timer.display(elapsed // 1000)
+    if self.__clock.running:
+      self.__refresh.start(1000 - elapsed % 1000)
 
-  @time.setter
-  def time(self, value: int) -> None:
-    self.__lcd_timer.display(value)
+  def reset_timer(self) -> None:
+    self.__refresh.stop()
+    self.__clock.reset()
+    self.__lcd_timer.display(0)
 
   def start_timer(self) -> None:
-    self.__stopwatch.start()
+    self.__clock.start()
+    self.__refresh.start(1000)
 
-  def halt_timer(self) -> int:
-    self.__stopwatch.stop()
-    return self.__lcd_timer.intValue()
+  def pause_timer(self) -> None:
+    self.__refresh.stop()
+    self.__clock.pause()
 
-  def decrement_mines(self) -> None:
-    self.__lcd_mines.display(self.__lcd_mines.intValue() - 1)
+  def resume_timer(self) -> None:
+    self.__clock.resume()
+    self.__refresh_timer()
 
-  def increment_mines(self) -> None:
-    self.__lcd_mines.display(self.__lcd_mines.intValue() + 1)
+  def halt_timer(self) -> int:
+    self.__refresh.stop()
+    elapsed = self.__clock.stop()
+    self.__refresh_timer()
+    return elapsed
 
 
 class GameFrame(QFrame):
   __slots__ = (
     '__header',
     '__grid',
+    '__input_filter',
+    '__act_on_press',
     '__board',
+    '__game',
     '__tiles',
+    '__time',
+    '__start_stamp',
     '__active',
-    '__active_tiles',
-    '__first_click',
-    '__open_tiles',
-    '__win_condition',
-    '__game_won',
-    '__game_lost',
     '__resize_callback',
     '__finish_callback',
-    '__open_queue',
   )
 
   def __init__(
     self,
-    finish_callback: Callable[[int, int], None],
+    finish_callback: Callable[[bool, int], None],
     resize_callback: Callable[[int, int], None],
     activate_menu: Callable[[], None],
+    act_on_press: bool = False,
     parent: QWidget = None,
   ) -> None:
     super().__init__(parent)
 
     self.setStyleSheet('background-color: #f0f0f0f0;')
-    self.__open_queue: set[Tile] = set()
     self.__active = False
     self.__grid: QWidget = None
     self.__resize_callback = resize_callback
     self.__finish_callback = finish_callback
+    self.__act_on_press = act_on_press
 
     layout = QVBoxLayout(self)
     layout.setAlignment(Qt.AlignTop)
     layout.setContentsMargins(5, 0, 20, 0)
-    self.__header = GameHeader(self.__init_game, activate_menu, self)
+    self.__header = GameHeader(self.__restart_game, activate_menu, self)
     layout.addWidget(self.__header)
 
   def __init_params(self) -> None:
-    self.__first_click = True
-    self.__open_tiles = 0
-    self.__game_won = False
-    self.__game_lost = False
-    self.__win_condition = self.__board.rows * self.__board.cols - self.__board.mines
-    self.__active_tiles: set[Tile] = set()
+    self.__game = Game(self.__board)
+    self.__time = 0
 
   def __init_header(self) -> None:
     self.__header.mines = self.__board.mines
-    self.__header.time = 0
+    self.__header.reset_timer()
 
   def __init_grid(self) -> None:
     if self.__grid is not None:
@@ -295,20 +325,21 @@ class GameFrame(QFrame):
     layout.setHorizontalSpacing(0)
     layout.setContentsMargins(8, 0, 0, 0)
     layout.setSizeConstraint(QGridLayout.SetFixedSize)
+
+    self.__input_filter = GridInputFilter(
+      self.__board.rows, self.__board.cols, self.__act_on_press, self.__handle_tile_event, self.__grid
+    )
+    self.__grid.installEventFilter(self.__input_filter)
     self.setFixedSize((self.__board.cols + 1) * Cfg.game_btn_height, (self.__board.rows + 2) * Cfg.game_btn_height)
 
   def __init_tiles(self) -> None:
     self.__init_grid()
     layout: QGridLayout = self.__grid.layout()
 
-    tiles = [
-      [Tile(i, j, self.__handle_tile_event, self.__grid) for j in range(self.__board.cols)]
-      for i in range(self.__board.rows)
-    ]
+    tiles = [[Tile(i, j, self.__grid) for j in range(self.__board.cols)] for i in range(self.__board.rows)]
 
     for row in tiles:
       for t in row:
-        t.neighbors = [tiles[i][j] for i, j in self.__board.get_neighbors(t.row, t.col)]
         layout.addWidget(t, t.row, t.col)
 
     self.__tiles = tiles
@@ -320,108 +351,73 @@ class GameFrame(QFrame):
     self.__resize_callback((self.__board.cols + 1) * Cfg.game_btn_height, (self.__board.rows + 2) * Cfg.game_btn_height)
     self.__active = True
 
-  def __handle_tile_event(self, event: TileEventType, tile: Tile) -> None:
-    if not self.__active:
-      return
-
-    match event:
-      case TileEventType.OPENSINGLE:
-        self.__process_tile(tile)
-      case TileEventType.OPENSQUARE:
-        self.__process_square(tile)
-      case TileEventType.MARK:
-        self.__process_mark(tile)
+  # every game gets a fresh seed so its move log can be replayed
+  def __restart_game(self) -> None:
+    self.__board = Board(self.__board.mode)
+    self.__init_game()
 
-  def __reveal_tile(self, tile: Tile) -> None:
-    if tile.flagged or tile.revealed:
+  # moves are timed by their input event timestamps, so input queued behind a busy event loop keeps its real
+  # spacing => game time is relative to the input that opened the first tile (and started the clock), minus the
+  # spans the clock spent paused
+  def __handle_tile_event(self, event: TileEventType, row: int, col: int, timestamp: int) -> None:
+    if not self.__active:
       return
 
-    tile.reveal()
-    self.__open_tiles += 1
+    if not self.__game.started:
+      self.__start_stamp = timestamp
+    move = Move(timestamp - self.__start_stamp - self.__header.paused_time, event, row, col)
 
-    if tile.val == -1:
-      self.__game_lost = True
-    elif self.__open_tiles == self.__win_condition:
-      self.__game_won = True
+    # the rules live in Game => only mirror what the move changed onto the widgets
+    started = self.__game.started
+    changed = self.__game.play(move)
+    if not started and self.__game.started:
+      self.__handle_first_click()
 
-    if tile.val == 0:
-      self.__enqueue_adjacent(tile)
+    for r, c in changed:
+      if self.__game.revealed(r, c):
+        self.__tiles[r][c].reveal()
+      else:
+        self.__tiles[r][c].set_mark(self.__game.mark(r, c))
 
-    self.__process_queue()
+    self.__header.mines = self.__board.mines - self.__game.flags
+    if self.__game.finished:
+      self.__finish_game()
 
-  def __process_tile(self, tile: Tile) -> None:
-    if self.__first_click:
-      self.__handle_first_click(tile)
+  def __handle_first_click(self) -> None:
+    for row in self.__tiles:
+      for t in row:
+        if val := self.__game.value(t.row, t.col):
+          t.init(val)
 
-    if tile.flagged or tile.revealed:
-      return
+    self.__header.start_timer()
 
-    self.__reveal_tile(tile)
-    self.__post_process_tile()
+  def __finish_game(self) -> None:
+    self.__active = False
+    if not self.__game.won:
+      for r, c in self.__board.mine_placement:
+        self.__tiles[r][c].reveal()
 
-  def __post_process_tile(self) -> None:
-    if not self.__game_lost and not self.__game_won:
-      return
+    self.__time = self.__header.halt_timer()
+    self.__finish_callback(self.__game.won, self.__time)
 
-    self.__active = False
-    if self.__game_lost:
-      for row in self.__tiles:
-        for t in row:
-          if t.val == -1:
-            t.reveal()
+  @property
+  def board(self) -> Board:
+    return self.__board
 
-    self.__finish_callback(not self.__game_lost, self.__header.halt_timer())
+  @property
+  def moves(self) -> list[Move]:
+    return self.__game.moves
 
-  def __process_square(self, tile: Tile) -> None:
-    if not tile.revealed or tile.val == 0:
-      return
+  def submission(self) -> dict:
+    return self.__game.submission(self.__time)
 
-    mines = 0
-    for t in tile.neighbors:
-      if t.flagged:
-        mines += 1
-
-    if mines == tile.val:
-      for t in tile.neighbors:
-        if not t.flagged and not t.revealed:
-          self.__reveal_tile(t)
-
-    self.__post_process_tile()
-
-  def __process_mark(self, tile: Tile) -> None:
-    if not tile.revealed:
-      flagged = tile.flagged
-      tile.change_mark()
-      if flagged and not tile.flagged:
-        self.__header.increment_mines()
-      elif not flagged and tile.flagged:
-        self.__header.decrement_mines()
-
-  def __enqueue_adjacent(self, tile) -> None:
-    for t in tile.neighbors:
-      if not t.revealed:
-        self.__open_queue.add(t)
-
-  def __process_queue(self) -> None:
-    while self.__open_queue:
-      tile = self.__open_queue.pop()
-      self.__reveal_tile(tile)
-
-  def __handle_first_click(self, tile: Tile) -> None:
-    self.__first_click = False
-    self.__board.calc_mine_placement(tile.row, tile.col)
-
-    for r, c in self.__board.mine_placement:
-      self.__tiles[r][c].val = -1
-      self.__active_tiles.add(self.__tiles[r][c])
-      for t in self.__tiles[r][c].neighbors:
-        t.increment_value()
-        self.__active_tiles.add(t)
-
-    for t in self.__active_tiles:
-      t.init()
+  def pause(self) -> None:
+    if self.__active:
+      self.__header.pause_timer()
 
-    self.__header.start_timer()
+  def resume(self) -> None:
+    if self.__active:
+      self.__header.resume_timer()
 
   def activate(self, mode: GameMode) -> None:
     self.__board = Board(mode)
@@ -1,5 +1,7 @@
 import random
+import time
 from enum import Enum
+from functools import cache
 from dataclasses import dataclass
 
 
@@ -12,6 +14,7 @@ class Cfg:
   menu_btn_height: int = 40
   game_btn_height: int = 40
   game_btn_width: int = 100
+  game_frame_ms: int = 16
   tile_txt_flagged: str = '🚩'
   tile_txt_question: str = '❓'
   tile_txt_mine: str = '💥'
@@ -40,6 +43,7 @@ class TileEventType(Enum):
   OPENSINGLE = 0
   OPENSQUARE = 1
   MARK = 2
+  CHORD = 3  # left + right together, opens the square like OPENSQUARE
 
 
 class TileNumberColor(Enum):
@@ -74,8 +78,82 @@ class TileNumberColor(Enum):
     }[val]
 
 
+@dataclass(frozen=True)
+class Move:
+  time: int
+  event: TileEventType
+  row: int
+  col: int
+
+
+class GameClock:
+  __slots__ = ('__started', '__resumed', '__elapsed', '__paused_at', '__paused')
+
+  def __init__(self) -> None:
+    self.reset()
+
+  @property
+  def running(self) -> bool:
+    return self.__resumed is not None
+
+  @property
+  def paused(self) -> bool:
+    return self.__started and self.__resumed is None
+
+  @property
+  def elapsed_ns(self) -> int:
+    if self.__resumed is None:
+      return self.__elapsed
+    return self.__elapsed + time.perf_counter_ns() - self.__resumed
+
+  @property
+  def elapsed_ms(self) -> int:
+    return self.elapsed_ns // 1_000_000
+
+  # time spent paused since start, lets other time bases (e.g. input event timestamps) skip the same spans
+  @property
+  def paused_ns(self) -> int:
+    if not self.paused:
+      return self.__paused
+    return self.__paused + time.perf_counter_ns() - self.__paused_at
+
+  @property
+  def paused_ms(self) -> int:
+    return self.paused_ns // 1_000_000
+
+  def reset(self) -> None:
+    self.__started = False
+    self.__resumed: int = None
+    self.__elapsed = 0
+    self.__paused_at: int = None
+    self.__paused = 0
+
+  def start(self) -> None:
+    self.reset()
+    self.__started = True
+    self.__resumed = time.perf_counter_ns()
+
+  def pause(self) -> None:
+    if self.__resumed is None:
+      return
+    self.__paused_at = time.perf_counter_ns()
+    self.__elapsed += self.__paused_at - self.__resumed
+    self.__resumed = None
+
+  def resume(self) -> None:
+    if self.paused:
+      self.__resumed = time.perf_counter_ns()
+      self.__paused += self.__resumed - self.__paused_at
+
+  # stops the clock for good, returns elapsed milliseconds
+  def stop(self) -> int:
+    self.pause()
+    self.__started = False
+    return self.elapsed_ms
+
+
 class Board:
-  __slots__ = ('__rows', '__cols', '__mines', '__coords', '__mine_placement')
+  __slots__ = ('__mode', '__seed', '__rng', '__rows', '__cols', '__mines', '__coords', '__mine_placement')
 
   @property
   def rows(self) -> int:
@@ -93,18 +171,26 @@ class Board:
   def mode(self) -> GameMode:
     return self.__mode
 
+  @property
+  def seed(self) -> int:
+    return self.__seed
+
   @property
   def mine_placement(self) -> list[tuple[int, int]]:
     return self.__mine_placement
 
-  def __init__(self, mode: GameMode) -> None:
+  # the same mode, seed and first click always produce the same mine placement
+  def __init__(self, mode: GameMode, seed: int = None) -> None:
+    self.__mode = mode
+    self.__seed = random.getrandbits(32) if seed is None else seed
+    self.__rng = random.Random(self.__seed)
     (self.__mines, self.__rows, self.__cols) = mode.value
     self.__coords = {(i, j) for i in range(self.__rows) for j in range(self.__cols)}
 
   def calc_mine_placement(self, row: int, col: int) -> None:
     neighborhood = self.get_square(row, col)
-    safe_coords = list(self.__coords.difference(neighborhood))
-    self.__mine_placement = random.sample(safe_coords, self.__mines)
+    safe_coords = sorted(self.__coords.difference(neighborhood))
+    self.__mine_placement = self.__rng.sample(safe_coords, self.__mines)
 
   def in_bounds(self, x: int, y: int) -> bool:
     return 0 <= x < self.__cols and 0 <= y < self.__rows
@@ -123,3 +209,174 @@ class Board:
       for i in range(max(0, row - 1), min(self.__rows, row + 2))
       for j in range(max(0, col - 1), min(self.__cols, col + 2))
     ]
+
+
+# neighbor indices of a row-major board only depend on the mode => build them once per process
+@cache
+def neighbor_table(mode: GameMode) -> list[list[int]]:
+  board = Board(mode, 0)
+  return [
+    [i * board.cols + j for i, j in board.get_neighbors(r, c)] for r in range(board.rows) for c in range(board.cols)
+  ]
+
+
+class Game:
+  __slots__ = (
+    '__board',
+    '__cols',
+    '__vals',
+    '__revealed',
+    '__marks',
+    '__neighbors',
+    '__first_click',
+    '__open_tiles',
+    '__flags',
+    '__moves',
+    '__win_condition',
+    '__game_won',
+    '__game_lost',
+    '__changed',
+  )
+
+  def __init__(self, board: Board) -> None:
+    size = board.rows * board.cols
+
+    self.__board = board
+    self.__cols = board.cols
+    self.__vals = [0] * size
+    self.__revealed = [False] * size
+    self.__marks = [TileButtonState.DEFAULT] * size
+    self.__neighbors = neighbor_table(board.mode)
+    self.__first_click = True
+    self.__open_tiles = 0
+    self.__flags = 0
+    self.__moves: list[Move] = []
+    self.__win_condition = size - board.mines
+    self.__game_won = False
+    self.__game_lost = False
+    self.__changed: list[tuple[int, int]] = []
+
+  @property
+  def board(self) -> Board:
+    return self.__board
+
+  @property
+  def started(self) -> bool:
+    return not self.__first_click
+
+  @property
+  def finished(self) -> bool:
+    return self.__game_won or self.__game_lost
+
+  @property
+  def won(self) -> bool:
+    return self.__game_won and not self.__game_lost
+
+  @property
+  def flags(self) -> int:
+    return self.__flags
+
+  @property
+  def moves(self) -> list[Move]:
+    return self.__moves
+
+  def value(self, row: int, col: int) -> int:
+    return self.__vals[row * self.__cols + col]
+
+  def revealed(self, row: int, col: int) -> bool:
+    return self.__revealed[row * self.__cols + col]
+
+  def mark(self, row: int, col: int) -> TileButtonState:
+    return self.__marks[row * self.__cols + col]
+
+  # records and applies a timed move, returns the cells it revealed or re-marked
+  def play(self, move: Move) -> list[tuple[int, int]]:
+    if not self.finished:
+      self.__moves.append(move)
+    return self.apply(move.event, move.row, move.col)
+
+  # the json layout read back by verifier.py
+  def submission(self, time: int) -> dict:
+    return {
+      'mode': self.__board.mode.name,
+      'seed': self.__board.seed,
+      'win': self.won,
+      'time': time,
+      'moves': [[m.time, m.event.name, m.row, m.col] for m in self.__moves],
+    }
+
+  # applies a move, returns the cells it revealed or re-marked
+  def apply(self, event: TileEventType, row: int, col: int) -> list[tuple[int, int]]:
+    self.__changed = []
+    if self.finished:
+      return self.__changed
+
+    idx = row * self.__cols + col
+    match event:
+      case TileEventType.OPENSINGLE:  # left click on a revealed tile opens its square
+        if self.__revealed[idx]:
+          self.__process_square(idx)
+        elif not self.__flagged(idx):
+          self.__process_tile(idx)
+      case TileEventType.OPENSQUARE | TileEventType.CHORD:
+        self.__process_square(idx)
+      case TileEventType.MARK:
+        self.__process_mark(idx)
+
+    return self.__changed
+
+  def __flagged(self, idx: int) -> bool:
+    return self.__marks[idx] == TileButtonState.FLAGGED
+
+  def __handle_first_click(self, idx: int) -> None:
+    self.__first_click = False
+    self.__board.calc_mine_placement(idx // self.__cols, idx % self.__cols)
+
+    for r, c in self.__board.mine_placement:
+      mine = r * self.__cols + c
+      self.__vals[mine] = -1
+      for n in self.__neighbors[mine]:
+        if self.__vals[n] != -1:
+          self.__vals[n] += 1
+
+  def __reveal_tile(self, idx: int) -> None:
+    queue = {idx}
+    while queue:
+      i = queue.pop()
+      if self.__flagged(i) or self.__revealed[i]:
+        continue
+
+      self.__revealed[i] = True
+      self.__open_tiles += 1
+      self.__changed.append(divmod(i, self.__cols))
+
+      if self.__vals[i] == -1:
+        self.__game_lost = True
+      elif self.__open_tiles == self.__win_condition:
+        self.__game_won = True
+
+      if self.__vals[i] == 0:
+        queue.update(n for n in self.__neighbors[i] if not self.__revealed[n])
+
+  def __process_tile(self, idx: int) -> None:
+    if self.__first_click:
+      self.__handle_first_click(idx)
+    self.__reveal_tile(idx)
+
+  def __process_square(self, idx: int) -> None:
+    if not self.__revealed[idx] or self.__vals[idx] == 0:
+      return
+
+    neighbors = self.__neighbors[idx]
+    if sum(1 for n in neighbors if self.__flagged(n)) == self.__vals[idx]:
+      for n in neighbors:
+        self.__reveal_tile(n)
+
+  def __process_mark(self, idx: int) -> None:
+    if self.__revealed[idx]:
+      return
+
+    flagged = self.__flagged(idx)
+    self.__marks[idx] = TileButtonState.next(self.__marks[idx])
+    self.__flags += self.__flagged(idx) - flagged
+    self.__changed.append(divmod(idx, self.__cols))
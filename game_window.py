@@ -1,6 +1,7 @@
 from menu_frame import MenuFrame
 from game_frame import GameFrame
 from game_utils import Cfg
+from PySide6.QtCore import QEvent, Qt
 from PySide6.QtWidgets import (
   QMainWindow,
   QVBoxLayout,
@@ -12,7 +13,7 @@ from PySide6.QtWidgets import (
 class GameWindow(QMainWindow):
   __slots__ = ('__root', '__frame_menu', '__frame_game')
 
-  def __init__(self) -> None:
+  def __init__(self, act_on_press: bool = False) -> None:
     super().__init__()
     self.setWindowTitle('pkqt Minesweeper')
     self.setStyleSheet('background-color: #f0f0f0;')
@@ -21,7 +22,7 @@ class GameWindow(QMainWindow):
     layout = QVBoxLayout(self.__root)
 
     self.__frame_menu = MenuFrame(self.__resize_window, self.__activate_game_frame)
-    self.__frame_game = GameFrame(self.__finish_game, self.__resize_window, self.__activate_menu_frame)
+    self.__frame_game = GameFrame(self.__finish_game, self.__resize_window, self.__activate_menu_frame, act_on_press)
 
     layout.addWidget(self.__frame_menu, 1)
     layout.addWidget(self.__frame_game, 1)
@@ -42,8 +43,17 @@ class GameWindow(QMainWindow):
   def __resize_window(self, width: int, height: int) -> None:
     self.setFixedSize(width + Cfg.wind_hrz_offset, height + Cfg.wind_vrt_offset)
 
+  # no point running the clock while the board cannot be seen
+  def changeEvent(self, event: QEvent) -> None:
+    if event.type() == QEvent.WindowStateChange:
+      if self.windowState() & Qt.WindowMinimized:
+        self.__frame_game.pause()
+      else:
+        self.__frame_game.resume()
+    return super().changeEvent(event)
+
   def __finish_game(self, win: bool, time: int) -> None:
-    msg = f'You won!\nFinished in {time} seconds!' if win else 'Boom! You lost!'
+    msg = f'You won!\nFinished in {time / 1000:.3f} seconds!' if win else 'Boom! You lost!'
     icon = QMessageBox.Information if win else QMessageBox.Critical
 
     QMessageBox(
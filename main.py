@@ -1,13 +1,18 @@
 import sys
+import argparse
 from PySide6.QtWidgets import QApplication
 from game_window import GameWindow
 
 
 def main() -> None:
-  app = QApplication(sys.argv)
+  parser = argparse.ArgumentParser(description='pkqt Minesweeper')
+  parser.add_argument('--act-on-press', action='store_true', help='open and mark tiles on mouse press, not release')
+  args, qt_args = parser.parse_known_args()
+
+  app = QApplication([sys.argv[0], *qt_args])
   app.setApplicationName('pkqt Minesweeper')
   app.setStyle('Fusion')
-  gw = GameWindow()
+  gw = GameWindow(args.act_on_press)
   gw.show()
   sys.exit(app.exec())
 
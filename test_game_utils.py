@@ -0,0 +1,91 @@
+import unittest
+from unittest import mock
+from game_utils import GameClock
+
+MS = 1_000_000
+
+
+class GameClockTest(unittest.TestCase):
+  def setUp(self) -> None:
+    self.now = 0
+    patcher = mock.patch('game_utils.time.perf_counter_ns', side_effect=lambda: self.now)
+    patcher.start()
+    self.addCleanup(patcher.stop)
+
+  def test_fresh_clock_is_idle(self) -> None:
+    clock = GameClock()
+    self.now = 5_000 * MS
+    self.assertFalse(clock.running)
+    self.assertFalse(clock.paused)
+    self.assertEqual(clock.elapsed_ms, 0)
+    self.assertEqual(clock.paused_ms, 0)
+
+  def test_start_and_stop(self) -> None:
+    clock = GameClock()
+    self.now = 100 * MS
+    clock.start()
+    self.now = 1_334 * MS + 999_999
+    self.assertTrue(clock.running)
+    self.assertEqual(clock.elapsed_ms, 1_234)
+    self.assertEqual(clock.stop(), 1_234)
+    self.assertFalse(clock.running)
+
+    # a stopped clock neither advances nor resumes
+    self.now = 9_000 * MS
+    clock.resume()
+    self.assertEqual(clock.elapsed_ms, 1_234)
+    self.assertFalse(clock.running)
+
+  def test_pause_and_resume_skip_the_paused_span(self) -> None:
+    clock = GameClock()
+    clock.start()
+    self.now = 1_000 * MS
+    clock.pause()
+    self.assertTrue(clock.paused)
+
+    self.now = 6_000 * MS
+    self.assertEqual(clock.elapsed_ms, 1_000)
+    self.assertEqual(clock.paused_ms, 5_000)
+
+    clock.resume()
+    self.now = 6_500 * MS
+    self.assertFalse(clock.paused)
+    self.assertEqual(clock.elapsed_ms, 1_500)
+    self.assertEqual(clock.paused_ms, 5_000)
+
+    clock.pause()
+    self.now = 7_500 * MS
+    clock.resume()
+    self.now = 8_000 * MS
+    self.assertEqual(clock.paused_ms, 6_000)
+    self.assertEqual(clock.stop(), 2_000)
+
+  def test_pause_before_start_and_double_pause_are_ignored(self) -> None:
+    clock = GameClock()
+    clock.pause()
+    self.assertFalse(clock.paused)
+
+    clock.start()
+    self.now = 1_000 * MS
+    clock.pause()
+    self.now = 2_000 * MS
+    clock.pause()
+    clock.resume()
+    self.now = 3_000 * MS
+    self.assertEqual(clock.elapsed_ms, 2_000)
+    self.assertEqual(clock.paused_ms, 1_000)
+
+  def test_restart_resets(self) -> None:
+    clock = GameClock()
+    clock.start()
+    self.now = 1_000 * MS
+    clock.pause()
+    self.now = 2_000 * MS
+    clock.start()
+    self.now = 2_500 * MS
+    self.assertEqual(clock.elapsed_ms, 500)
+    self.assertEqual(clock.paused_ms, 0)
+
+
+if __name__ == '__main__':
+  unittest.main()
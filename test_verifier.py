@@ -0,0 +1,112 @@
+import json
+import unittest
+from game_utils import Board, Game, GameMode, Move, TileEventType
+from verifier import Limits, verify
+
+MODE = GameMode.BEGINNER
+FIRST = (4, 4)
+
+
+# finds a seed whose first click leaves a numbered tile that a chord can open further tiles around
+def find_chord_seed() -> tuple[int, tuple[int, int]]:
+  for seed in range(1000):
+    board = Board(MODE, seed)
+    game = Game(board)
+    game.apply(TileEventType.OPENSINGLE, *FIRST)
+    if game.finished:
+      continue
+
+    mines = set(board.mine_placement)
+    for r in range(board.rows):
+      for c in range(board.cols):
+        if not game.revealed(r, c) or game.value(r, c) <= 0:
+          continue
+        hidden = [n for n in board.get_neighbors(r, c) if not game.revealed(*n)]
+        if any(n not in mines for n in hidden):
+          return seed, (r, c)
+  raise AssertionError('no seed with a chordable tile')
+
+
+# plays a winning press-mode game through Game.play: right button first on a numbered tile (MARK, ignored on a
+# revealed tile), the left button 4 ms later completes the chord => serialized by the game's own Game.submission
+def press_mode_chord_log() -> dict:
+  seed, target = find_chord_seed()
+  board = Board(MODE, seed)
+  game = Game(board)
+  game.play(Move(0, TileEventType.OPENSINGLE, *FIRST))
+
+  t = 0
+  mines = set(board.mine_placement)
+  for n in board.get_neighbors(*target):
+    if n in mines:
+      t += 200
+      game.play(Move(t, TileEventType.MARK, *n))
+
+  t += 200
+  game.play(Move(t, TileEventType.MARK, *target))
+  t += 4
+  assert game.play(Move(t, TileEventType.CHORD, *target)), 'chord opened nothing'
+
+  for r in range(board.rows):
+    for c in range(board.cols):
+      if game.finished:
+        break
+      if (r, c) not in mines and not game.revealed(r, c):
+        t += 150
+        game.play(Move(t, TileEventType.OPENSINGLE, r, c))
+
+  assert game.won, 'log does not win'
+  return game.submission(t + 3)
+
+
+class VerifyTest(unittest.TestCase):
+  def test_press_mode_chord_passes(self) -> None:
+    verdict = verify('chord.json', json.loads(json.dumps(press_mode_chord_log())), Limits())
+    self.assertEqual(verdict.issues, [])
+    self.assertTrue(verdict.valid)
+
+  def test_fast_single_move_is_flagged(self) -> None:
+    data = press_mode_chord_log()
+    data['moves'][-1][0] = data['moves'][-2][0] + 2
+    data['time'] = data['moves'][-1][0]
+    verdict = verify('fast.json', data, Limits())
+    self.assertFalse(verdict.valid)
+    self.assertIn('ms after the previous one', verdict.issues[0])
+
+  def test_chained_chords_are_flagged(self) -> None:
+    data = press_mode_chord_log()
+    chord = next(i for i, m in enumerate(data['moves']) if m[1] == 'CHORD')
+    t, _, row, col = data['moves'][chord]
+    data['moves'][chord + 1 : chord + 1] = [[t, 'CHORD', row, col], [t, 'CHORD', (row + 4) % 9, (col + 4) % 9]]
+    verdict = verify('chained.json', data, Limits())
+    self.assertFalse(verdict.valid)
+    self.assertEqual(
+      verdict.issues,
+      [f'move {chord + 1} only 0 ms after the previous one', f'move {chord + 2} only 0 ms after the previous one'],
+    )
+
+  def test_wrong_outcome_is_flagged(self) -> None:
+    data = press_mode_chord_log()
+    data['win'] = False
+    verdict = verify('outcome.json', data, Limits())
+    self.assertEqual(verdict.issues, ['claimed loss, replay ends in win'])
+
+  def test_json_types_are_strict(self) -> None:
+    for key, value in (('win', 'false'), ('win', 1), ('time', 12.5), ('seed', True), ('mode', 0)):
+      with self.subTest(key=key, value=value):
+        data = press_mode_chord_log()
+        data[key] = value
+        verdict = verify('types.json', data, Limits())
+        self.assertFalse(verdict.valid)
+        self.assertIn('malformed submission', verdict.issues[0])
+
+  def test_fractional_move_is_malformed(self) -> None:
+    data = press_mode_chord_log()
+    data['moves'][1][2] = 1.7
+    verdict = verify('fraction.json', data, Limits())
+    self.assertFalse(verdict.valid)
+    self.assertIn('malformed submission', verdict.issues[0])
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,190 @@
+import os
+import sys
+import json
+import time
+import argparse
+from pathlib import Path
+from dataclasses import dataclass, field, asdict
+from concurrent.futures import ProcessPoolExecutor
+from game_utils import Board, Game, GameMode, Move, TileEventType
+
+# submission file layout (json), as written by Game.submission / GameFrame.submission:
+# {
+#   "mode": "EXPERT",
+#   "seed": 1234567,
+#   "win": true,
+#   "time": 81234,
+#   "moves": [[0, "OPENSINGLE", 7, 12], [412, "MARK", 6, 11], [598, "MARK", 7, 12], [603, "CHORD", 7, 12], ...]
+# }
+# move times are input event milliseconds since the first opened tile, as recorded in GameFrame.moves,
+# the claimed time is the game clock and may differ from the last move by the input handling latency
+
+
+@dataclass(frozen=True)
+class Limits:
+  min_interval: int = 10
+  time_tolerance: int = 1000
+
+
+@dataclass
+class Verdict:
+  path: str
+  valid: bool = True
+  win: bool | None = None
+  time: int | None = None
+  issues: list[str] = field(default_factory=list)
+
+  def flag(self, issue: str) -> None:
+    self.valid = False
+    self.issues.append(issue)
+
+
+# bool is an int subclass => compare exact types so 1 / true or "false" / false never stand in for each other
+def expect(value, kind: type, name: str):
+  if type(value) is not kind:
+    raise TypeError(f'{name} must be {kind.__name__}, got {value!r}')
+  return value
+
+
+def parse_move(raw: list) -> Move:
+  t, event, row, col = expect(raw, list, 'move')
+  return Move(
+    expect(t, int, 'move time'),
+    TileEventType[expect(event, str, 'move event')],
+    expect(row, int, 'move row'),
+    expect(col, int, 'move col'),
+  )
+
+
+# a chord is the second button of one gesture => in press mode it lands right after the first button's own move
+# on the same cell, anything else chained to it has to respect the usual gap
+def completes_chord(prev: Move, move: Move) -> bool:
+  return (
+    move.event == TileEventType.CHORD
+    and prev.event in (TileEventType.MARK, TileEventType.OPENSINGLE)
+    and (prev.row, prev.col) == (move.row, move.col)
+  )
+
+
+def verify(path: str, data: dict, limits: Limits) -> Verdict:
+  verdict = Verdict(path)
+  try:
+    board = Board(GameMode[expect(data['mode'], str, 'mode')], expect(data['seed'], int, 'seed'))
+    moves = [parse_move(m) for m in expect(data['moves'], list, 'moves')]
+    verdict.win = expect(data['win'], bool, 'win')
+    verdict.time = expect(data['time'], int, 'time')
+  except (KeyError, TypeError, ValueError) as e:
+    verdict.flag(f'malformed submission: {e!r}')
+    return verdict
+
+  replay = Game(board)
+  prev: Move = None
+  for i, move in enumerate(moves):
+    if replay.finished:
+      verdict.flag(f'{len(moves) - i} move(s) after the game ended')
+      break
+    if not (0 <= move.row < board.rows and 0 <= move.col < board.cols):
+      verdict.flag(f'move {i} out of bounds: ({move.row}, {move.col})')
+      return verdict
+
+    # the clock starts on the first opened tile => everything up to and including it happens at 0
+    if not replay.started and move.time != 0:
+      verdict.flag(f'move {i} at {move.time} ms before the clock started')
+    elif prev is not None and move.time < prev.time:
+      verdict.flag(f'move {i} goes back in time: {prev.time} -> {move.time} ms')
+    elif (
+      prev is not None
+      and replay.started
+      and not completes_chord(prev, move)
+      and move.time - prev.time < limits.min_interval
+    ):
+      verdict.flag(f'move {i} only {move.time - prev.time} ms after the previous one')
+
+    replay.apply(move.event, move.row, move.col)
+    prev = move
+
+  if not replay.finished:
+    verdict.flag('moves do not finish the game')
+  elif replay.won != verdict.win:
+    verdict.flag(f'claimed {"win" if verdict.win else "loss"}, replay ends in {"win" if replay.won else "loss"}')
+
+  last = prev.time if prev is not None else 0
+  if abs(verdict.time - last) > limits.time_tolerance:
+    verdict.flag(f'claimed time {verdict.time} ms does not match the last move at {last} ms')
+
+  return verdict
+
+
+def verify_file(path: str, limits: Limits) -> Verdict:
+  try:
+    data = json.loads(Path(path).read_text(encoding='utf-8'))
+  except (OSError, ValueError) as e:
+    verdict = Verdict(path)
+    verdict.flag(f'unreadable submission: {e!r}')
+    return verdict
+  return verify(path, data, limits)
+
+
+def collect(paths: list[str]) -> list[str]:
+  files = []
+  for p in map(Path, paths):
+    files.extend(sorted(str(f) for f in p.rglob('*.json')) if p.is_dir() else [str(p)])
+  return files
+
+
+def bounded_int(minimum: int):
+  def integer(text: str) -> int:
+    value = int(text)
+    if value < minimum:
+      raise argparse.ArgumentTypeError(f'must be at least {minimum}, got {value}')
+    return value
+
+  return integer
+
+
+def run(files: list[str], limits: Limits, jobs: int = None) -> list[Verdict]:
+  if jobs is None:
+    jobs = os.cpu_count() or 1
+  chunksize = max(1, len(files) // (jobs * 8))
+  with ProcessPoolExecutor(max_workers=jobs) as pool:
+    return list(pool.map(verify_file, files, [limits] * len(files), chunksize=chunksize))
+
+
+def main() -> None:
+  parser = argparse.ArgumentParser(description='Replay submitted minesweeper move logs and verify their results.')
+  parser.add_argument('paths', nargs='+', help='submission files or directories searched for *.json')
+  parser.add_argument('-j', '--jobs', type=bounded_int(1), default=None, help='worker processes (default: cpu count)')
+  # 0 is meaningful for the limits => disables the gap check / demands an exact claimed time
+  parser.add_argument(
+    '--min-interval', type=bounded_int(0), default=Limits.min_interval, help='fastest allowed move gap, ms'
+  )
+  parser.add_argument(
+    '--time-tolerance', type=bounded_int(0), default=Limits.time_tolerance, help='allowed claimed time skew, ms'
+  )
+  parser.add_argument('--json', action='store_true', help='print the full report as json')
+  args = parser.parse_args()
+
+  start = time.perf_counter()
+  files = collect(args.paths)
+  verdicts = run(files, Limits(args.min_interval, args.time_tolerance), args.jobs)
+  flagged = [v for v in verdicts if not v.valid]
+  elapsed = time.perf_counter() - start
+
+  if args.json:
+    report = {
+      'total': len(verdicts),
+      'flagged': len(flagged),
+      'seconds': round(elapsed, 3),
+      'results': [asdict(v) for v in verdicts],
+    }
+    print(json.dumps(report, indent=2))
+  else:
+    for v in flagged:
+      print(f'{v.path}: {"; ".join(v.issues)}')
+    print(f'{len(verdicts) - len(flagged)}/{len(verdicts)} verified, {len(flagged)} flagged in {elapsed:.2f}s')
+
+  sys.exit(1 if flagged else 0)
+
+
+if __name__ == '__main__':
+  main()